@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import io
 import threading
+from collections import deque
 from dataclasses import dataclass
-from pathlib import Path
-from tempfile import NamedTemporaryFile
-from typing import Optional, Union
-import time
+from queue import SimpleQueue
+from typing import Deque, Optional, Union
 
 try:
     import numpy as np
@@ -19,10 +19,12 @@ except ImportError:  # pragma: no cover - handled at runtime for CLI scenarios
 
 DeviceSpecifier = Union[int, str, None]
 
+_PCM16_FULL_SCALE = 32768.0
 
-@dataclass
+
+@dataclass(slots=True)
 class CapturedAudio:
-    path: Path
+    data: bytes
     level: float
 
 
@@ -31,7 +33,7 @@ class RecordingCancelled(Exception):
 
 
 class AudioCaptureService:
-    """Records short microphone snippets to temporary WAV files."""
+    """Records short microphone snippets as in-memory WAV data."""
 
     def __init__(
         self,
@@ -48,8 +50,12 @@ class AudioCaptureService:
         self._channels = channels
         self._input_device = self._coerce_device(input_device)
         self._default_duration = max(1, default_duration)
-        self._dtype = "float32"
+        self._dtype = "int16"
         self._block_size = max(int(self._sample_rate * 0.1), 512)
+        # Released snippets are recycled instead of allocating one per capture.
+        self._pool: Deque[CapturedAudio] = deque(maxlen=4)
+        # Peak of the most recent block, written by the PortAudio callback for meters.
+        self._live_level = 0.0
 
     def record_snippet(
         self,
@@ -64,41 +70,89 @@ class AudioCaptureService:
         if stop_event.is_set():
             raise RecordingCancelled
 
+        wav = io.BytesIO()
+        peak_level = self._stream_to_wav(wav, total_frames, stop_event)
+        normalized = max(0.0, min(1.0, peak_level))
         try:
-            buffer = sd.rec(
-                total_frames,
+            captured = self._pool.popleft()
+        except IndexError:
+            return CapturedAudio(wav.getvalue(), normalized)
+        captured.data = wav.getvalue()
+        captured.level = normalized
+        return captured
+
+    def release(self, captured: CapturedAudio) -> None:
+        """Return a snippet whose audio has been consumed so it can be reused."""
+        captured.data = b""
+        self._pool.append(captured)
+
+    def _stream_to_wav(
+        self, sink: io.BytesIO, total_frames: int, stop_event: threading.Event
+    ) -> float:
+        """Encode blocks into ``sink`` as PortAudio delivers them; returns the normalized peak."""
+        peak_level = 0.0
+        frames_captured = 0
+        # The PortAudio callback only hands blocks over; this thread does the WAV encoding
+        # so a slow write can never stall the audio callback. ``None`` ends the stream.
+        blocks: SimpleQueue[Optional[np.ndarray]] = SimpleQueue()
+        wait_limit = total_frames / self._sample_rate + 1
+
+        def _wake_on_stop() -> None:
+            # Wake the writer as soon as the user cancels instead of polling.
+            if stop_event.wait(timeout=wait_limit):
+                blocks.put(None)
+
+        watcher = threading.Thread(target=_wake_on_stop, daemon=True)
+
+        def callback(indata: np.ndarray, frames: int, time_info, status) -> None:
+            nonlocal peak_level, frames_captured
+            # PortAudio reuses ``indata`` once the callback returns.
+            block = indata[: total_frames - frames_captured].copy()
+            blocks.put(block)
+            block_peak = _peak(block)
+            peak_level = max(peak_level, block_peak)
+            self._live_level = block_peak / _PCM16_FULL_SCALE
+            frames_captured += len(block)
+            if frames_captured >= total_frames:
+                raise sd.CallbackStop
+
+        try:
+            with sf.SoundFile(
+                sink,
+                mode="w",
+                samplerate=self._sample_rate,
+                channels=self._channels,
+                format="WAV",
+                subtype="PCM_16",
+            ) as snd, sd.InputStream(
                 samplerate=self._sample_rate,
                 channels=self._channels,
                 dtype=self._dtype,
                 device=self._input_device,
-            )
-            start_time = time.monotonic()
-            poll_ms = 50
-            while True:
-                if stop_event.is_set():
-                    sd.stop()
-                    sd.wait()
-                    raise RecordingCancelled
-                elapsed = time.monotonic() - start_time
-                if elapsed >= duration:
-                    break
-                sd.sleep(poll_ms)
-            sd.wait()
+                blocksize=self._block_size,
+                callback=callback,
+                finished_callback=lambda: blocks.put(None),
+            ):
+                watcher.start()
+                while (block := blocks.get()) is not None:
+                    snd.write(block)
+            if stop_event.is_set() and frames_captured < total_frames:
+                raise RecordingCancelled
         except RecordingCancelled:
             raise
         except Exception as exc:  # pragma: no cover - hardware dependent
-            sd.stop()
             raise RuntimeError(
                 "Audio capture failed; check your microphone permissions and device"
             ) from exc
+        finally:
+            self._live_level = 0.0
 
-        recording = np.copy(buffer)
-        peak_level = float(np.max(np.abs(recording))) if recording.size else 0.0
-        normalized = max(0.0, min(1.0, peak_level))
+        return peak_level / _PCM16_FULL_SCALE
 
-        with NamedTemporaryFile(prefix="zva_", suffix=".wav", delete=False) as tmp:
-            sf.write(tmp.name, recording, self._sample_rate)
-            return CapturedAudio(Path(tmp.name), normalized)
+    @property
+    def live_level(self) -> float:
+        """Normalized peak of the latest captured block, or 0.0 when idle."""
+        return self._live_level
 
     def _coerce_device(self, device: DeviceSpecifier) -> DeviceSpecifier:
         if isinstance(device, str):
@@ -111,3 +165,11 @@ class AudioCaptureService:
         if isinstance(device, int):
             return device
         return None
+
+
+def _peak(samples: np.ndarray) -> float:
+    """Return the absolute peak without allocating an ``abs()`` copy of the buffer."""
+    if not samples.size:
+        return 0.0
+    # Widen to Python ints first so negating the int16 minimum cannot overflow.
+    return float(max(int(samples.max()), -int(samples.min())))
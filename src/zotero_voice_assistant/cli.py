@@ -2,11 +2,9 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from typing import List, Optional
 
-from .config import get_settings
-from .zotero_client import ZoteroClient
-
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
@@ -55,6 +53,10 @@ def handle_search(args: argparse.Namespace) -> None:
     if not any((args.author, args.title, args.year)):
         raise SystemExit("Provide at least one of --author, --title, or --year")
 
+    # import lazily so --help and audio-devices skip pyzotero and friends
+    from .config import get_settings
+    from .zotero_client import ZoteroClient
+
     settings = get_settings()
     client = ZoteroClient(settings)
     print(client.describe_target())
@@ -66,35 +68,44 @@ def handle_search(args: argparse.Namespace) -> None:
     )
 
     if args.raw:
-        print(json.dumps(matches, indent=2))
+        indent = 2 if sys.stdout.isatty() else None
+        # Drop client-side cache keys so the dump matches what the Zotero API returned.
+        records = [
+            {key: value for key, value in item.items() if not key.startswith("_")}
+            for item in matches
+        ]
+        print(json.dumps(records, indent=indent))
         return
 
     if not matches:
         print("No items found.")
         return
 
+    lines: List[str] = []
     for idx, item in enumerate(matches, start=1):
         data = item.get("data", {})
         title = data.get("title", "Untitled")
-        authors = ", ".join(
-            filter(
-                None,
-                [
-                    " ".join(
+        authors = item.get("_authors_cached")
+        if authors is None:
+            authors = ", ".join(
+                name
+                for creator in data.get("creators", [])
+                if (
+                    name := " ".join(
                         part for part in (creator.get("firstName"), creator.get("lastName")) if part
                     )
-                    for creator in data.get("creators", [])
-                ],
+                )
             )
-        )
         year = (data.get("date") or "").split("-")[0]
         url = data.get("url", "(no url)")
-        print(f"{idx}. {title}")
+        lines.append(f"{idx}. {title}")
         if authors:
-            print(f"   Authors: {authors}")
+            lines.append(f"   Authors: {authors}")
         if year:
-            print(f"   Year: {year}")
-        print(f"   Key: {item.get('key')}\n   URL: {url}\n")
+            lines.append(f"   Year: {year}")
+        lines.append(f"   Key: {item.get('key')}\n   URL: {url}\n")
+    # one write instead of a print per line keeps large --limit output cheap
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def main(argv: Optional[List[str]] = None) -> None:
@@ -122,20 +133,24 @@ def handle_audio_devices(args: argparse.Namespace) -> None:
 
     devices = sd.query_devices()
     header = "Idx  Name (channels)"
-    print(header)
-    print("-" * len(header))
+    lines = [header, "-" * len(header)]
     for idx, device in enumerate(devices):
-        inputs = device.get("max_input_channels", 0)
-        outputs = device.get("max_output_channels", 0)
+        get = device.get
+        inputs = get("max_input_channels", 0)
+        outputs = get("max_output_channels", 0)
         if inputs <= 0 and not args.all:
             continue
-        role = []
-        if inputs > 0:
-            role.append(f"in:{inputs}")
-        if outputs > 0:
-            role.append(f"out:{outputs}")
-        role_text = ", ".join(role) or "n/a"
-        print(f"[{idx:>2}] {device.get('name', 'Unknown')} ({role_text})")
+        role_text = (
+            f"in:{inputs}, out:{outputs}"
+            if inputs > 0 and outputs > 0
+            else f"in:{inputs}"
+            if inputs > 0
+            else f"out:{outputs}"
+            if outputs > 0
+            else "n/a"
+        )
+        lines.append(f"[{idx:>2}] {get('name', 'Unknown')} ({role_text})")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def handle_run(args: argparse.Namespace) -> None:
@@ -1,15 +1,16 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
-from typing import List, Optional
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import List, Optional, Tuple
 
 from dotenv import load_dotenv
 
 load_dotenv()
 
 
-@dataclass
+@dataclass(frozen=True)
 class AppSettings:
     openai_api_key: str
     openai_model: str = "gpt-4o-mini-transcribe"
@@ -19,16 +20,16 @@ class AppSettings:
     zotero_library_id: str = ""
     zotero_library_type: str = "user"
     zotero_use_local: bool = False
-    activation_keywords: List[str] = field(
-        default_factory=lambda: ["citation assistant", "find paper"]
-    )
+    activation_keywords: Tuple[str, ...] = ("citation assistant", "find paper")
     audio_sample_rate: int = 16000
     audio_channels: int = 1
     audio_input_device: Optional[str] = None
     audio_default_duration: int = 5
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> AppSettings:
+    """Read settings from the environment once; later calls share the same instance."""
     return AppSettings(
         openai_api_key=os.getenv("OPENAI_API_KEY", ""),
         openai_model=os.getenv("OPENAI_AUDIO_MODEL", "gpt-4o-mini-transcribe"),
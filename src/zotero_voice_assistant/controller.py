@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import inspect
+import re
 import threading
-from contextlib import suppress
-from pathlib import Path
-from typing import Callable, List, Optional
+import weakref
+from collections import deque
+from concurrent.futures import Future
+from typing import Any, Callable, Deque, Dict, Generic, Iterable, List, Optional, Tuple, TypeVar
 
 from .audio import AudioCaptureService, CapturedAudio, RecordingCancelled
 from .config import AppSettings
@@ -15,8 +18,56 @@ LogCallback = Callable[[str], None]
 TranscriptCallback = Callable[[str], None]
 RecordingStateCallback = Callable[[bool], None]
 ResultsCallback = Callable[[List[dict]], None]
+ProcessingStateCallback = Callable[[bool], None]
 RetryPrompt = Callable[[bool], str]
 
+# Indexed by which intent fields are set: bit 0 author, bit 1 title, bit 2 year.
+_INTENT_FIELD_TEXT = {
+    0b001: "author field",
+    0b010: "title field",
+    0b011: "author and title fields",
+    0b100: "year field",
+    0b101: "author and year fields",
+    0b110: "title and year fields",
+    0b111: "author, title, and year fields",
+}
+
+CallbackT = TypeVar("CallbackT", bound=Callable[..., None])
+
+
+class _Listeners(Generic[CallbackT]):
+    """Copy-on-write listener registry that holds bound methods weakly.
+
+    Dispatch iterates an immutable tuple snapshot; callbacks whose owner has been
+    garbage collected (e.g. a destroyed window) are dropped on the next notify.
+    """
+
+    def __init__(self) -> None:
+        self._refs: Tuple[Callable[[], Optional[CallbackT]], ...] = ()
+        self._write_lock = threading.Lock()
+
+    def add(self, callback: CallbackT) -> None:
+        if inspect.ismethod(callback):
+            ref: Callable[[], Optional[CallbackT]] = weakref.WeakMethod(callback)
+        else:
+            # Plain functions and lambdas often have no other owner; keep them alive.
+            ref = lambda: callback
+        with self._write_lock:
+            self._refs = (*self._refs, ref)
+
+    def notify(self, *args: Any) -> None:
+        refs = self._refs
+        dead = False
+        for ref in refs:
+            callback = ref()
+            if callback is None:
+                dead = True
+                continue
+            callback(*args)
+        if dead:
+            with self._write_lock:
+                self._refs = tuple(ref for ref in self._refs if ref() is not None)
+
 
 class AssistantController:
     def __init__(
@@ -33,30 +84,47 @@ class AssistantController:
         self._zotero_client = zotero_client
         self._intent_parser = intent_parser
         self._listening = False
-        self._listeners: List[StatusCallback] = []
-        self._loggers: List[LogCallback] = []
-        self._transcript_listeners: List[TranscriptCallback] = []
-        self._recording_state_listeners: List[RecordingStateCallback] = []
-        self._results_listeners: List[ResultsCallback] = []
+        self._listeners: _Listeners[StatusCallback] = _Listeners()
+        self._loggers: _Listeners[LogCallback] = _Listeners()
+        self._transcript_listeners: _Listeners[TranscriptCallback] = _Listeners()
+        self._recording_state_listeners: _Listeners[RecordingStateCallback] = _Listeners()
+        self._results_listeners: _Listeners[ResultsCallback] = _Listeners()
+        self._processing_listeners: _Listeners[ProcessingStateCallback] = _Listeners()
+        # Filled by any thread, drained by the UI thread via drain_logs().
+        self._log_queue: Deque[str] = deque(maxlen=256)
         self._retry_prompt: Optional[RetryPrompt] = None
         self._worker: Optional[threading.Thread] = None
+        # Capture and processing run on separate threads joined by a one-clip slot.
+        # Clips are tagged with the run that recorded them; _run_id is the latest run.
+        # The condition also lets stop() wake a capture thread waiting on a full slot.
+        self._handoff = threading.Condition()
+        self._pending_clip: Optional[Tuple[int, CapturedAudio]] = None
+        self._clips_in_flight = 0
+        self._run_id = 0
+        self._processor: Optional[threading.Thread] = None
         self._stop_event = threading.Event()
         self._latest_results: List[dict] = []
+        # Child attachments of the latest results, fetched in the background by item key.
+        self._attachments: Dict[str, Future[List[dict]]] = {}
+        self._activation_pattern = _compile_activation_pattern(settings.activation_keywords)
 
     def add_status_listener(self, callback: StatusCallback) -> None:
-        self._listeners.append(callback)
+        self._listeners.add(callback)
 
     def add_log_listener(self, callback: LogCallback) -> None:
-        self._loggers.append(callback)
+        self._loggers.add(callback)
 
     def add_transcript_listener(self, callback: TranscriptCallback) -> None:
-        self._transcript_listeners.append(callback)
+        self._transcript_listeners.add(callback)
 
     def add_recording_listener(self, callback: RecordingStateCallback) -> None:
-        self._recording_state_listeners.append(callback)
+        self._recording_state_listeners.add(callback)
 
     def add_results_listener(self, callback: ResultsCallback) -> None:
-        self._results_listeners.append(callback)
+        self._results_listeners.add(callback)
+
+    def add_processing_listener(self, callback: ProcessingStateCallback) -> None:
+        self._processing_listeners.add(callback)
 
     def set_retry_prompt_handler(self, handler: RetryPrompt) -> None:
         self._retry_prompt = handler
@@ -64,34 +132,51 @@ class AssistantController:
     def start(self) -> None:
         if self._listening:
             return
-        self._stop_event = threading.Event()
+        self._stop_event.clear()
         self._listening = True
+        self._run_id += 1
         self._push_status(True)
-        self._worker = threading.Thread(target=self._run_pipeline, daemon=True)
+        if self._processor is None:
+            self._processor = threading.Thread(target=self._process_captures, daemon=True)
+            self._processor.start()
+        self._worker = threading.Thread(
+            target=self._run_capture, args=(self._run_id,), daemon=True
+        )
         self._worker.start()
         self._log(
             f"Assistant activated (recording up to {self._settings.audio_default_duration} seconds)"
         )
         self._log(f"Zotero target: {self._zotero_client.describe_target()}")
-        self._push_results([])
+        if not self.is_processing:
+            # Keep results on screen while an earlier clip is still on its way to them.
+            self._push_results([])
 
     def stop(self) -> None:
         if not self._listening:
             return
         self._stop_event.set()
+        with self._handoff:
+            self._handoff.notify_all()
         self._log("Stopping current run...")
 
+    def drain_logs(self) -> None:
+        """Deliver queued log messages to listeners; call from the UI thread."""
+        log_queue = self._log_queue
+        while log_queue:
+            self._loggers.notify(log_queue.popleft())
+
     def resolve_item_location(self, item: dict) -> Optional[str]:
         title = item.get("data", {}).get("title", "Untitled")
-        location = self._zotero_client.get_attachment_or_url(item)
+        location = self._zotero_client.get_attachment_or_url(
+            item, self._prefetched_attachments(item["key"])
+        )
         if location:
             self._log(f"Resolved location for '{title}' -> {location}")
         else:
             self._log(f"No attachment or URL available for '{title}'")
         return location
 
-    def _run_pipeline(self) -> None:
-        snippet: Optional[Path] = None
+    def _run_capture(self, run_id: int) -> None:
         try:
             self._push_recording_state(True)
             self._log(
@@ -101,35 +186,64 @@ class AssistantController:
                 duration_seconds=self._settings.audio_default_duration,
                 stop_event=self._stop_event,
             )
-            snippet = captured.path
             self._push_recording_state(False)
-
-            self._log("Transcribing audio with OpenAI...")
-            transcript = self._openai_client.transcribe_file(snippet)
-            pretty_transcript = transcript.strip() or "[empty]"
-            self._log(f"Raw audio transcription: {pretty_transcript}")
-            self._push_transcript(transcript)
-            self._handle_transcript(transcript)
+            self._hand_off(run_id, captured)
         except RecordingCancelled:
             self._log("Recording cancelled")
-        except NotImplementedError as exc:
-            self._log(str(exc))
         except Exception as exc:
             self._log(f"Pipeline error: {exc}")
         finally:
-            if snippet is not None:
-                with suppress(FileNotFoundError, PermissionError):
-                    snippet.unlink(missing_ok=True)
             self._cleanup_after_run()
 
+    def _hand_off(self, run_id: int, captured: CapturedAudio) -> None:
+        """Queue a clip for processing; waits while an earlier clip is still queued."""
+        with self._handoff:
+            while self._pending_clip is not None:
+                if self._stop_event.is_set():
+                    self._audio_capture.release(captured)
+                    raise RecordingCancelled
+                self._handoff.wait()
+            self._pending_clip = (run_id, captured)
+            self._clips_in_flight += 1
+            self._handoff.notify_all()
+
+    def _process_captures(self) -> None:
+        """Transcribe and search queued clips so the microphone can re-arm meanwhile."""
+        while True:
+            with self._handoff:
+                while self._pending_clip is None:
+                    self._handoff.wait()
+                run_id, captured = self._pending_clip
+                self._pending_clip = None
+                self._handoff.notify_all()
+            self._push_processing_state(True)
+            try:
+                self._log("Transcribing audio with OpenAI...")
+                transcript = self._openai_client.transcribe_buffer(captured.data)
+                pretty_transcript = transcript.strip() or "[empty]"
+                self._log(f"Raw audio transcription: {pretty_transcript}")
+                self._push_transcript(transcript)
+                self._handle_transcript(transcript, run_id)
+            except NotImplementedError as exc:
+                self._log(str(exc))
+            except Exception as exc:
+                self._log(f"Pipeline error: {exc}")
+            finally:
+                self._audio_capture.release(captured)
+                with self._handoff:
+                    self._clips_in_flight -= 1
+                    idle = self._clips_in_flight == 0
+                if idle:
+                    self._push_processing_state(False)
+
     def _cleanup_after_run(self) -> None:
         self._push_recording_state(False)
         self._stop_event.set()
         self._listening = False
         self._push_status(False)
-        self._log("Assistant stopped")
+        self._log("Assistant stopped listening")
 
-    def _handle_transcript(self, transcript: str) -> None:
+    def _handle_transcript(self, transcript: str, run_id: int) -> None:
         query = self._extract_query(transcript)
         if not query:
             self._log("Nothing transcribed; press 'Record Clip' to try again")
@@ -149,6 +263,10 @@ class AssistantController:
         expanded = False
         while not matches:
             self._log("No Zotero items matched")
+            if run_id != self._run_id:
+                # A newer recording owns the UI now; don't interrupt it with a dialog.
+                self._log("Skipping retry prompt for an earlier clip")
+                return
             choice = self._prompt_retry(expand_allowed=not expanded)
             if choice == "expand" and not expanded:
                 expanded = True
@@ -163,39 +281,53 @@ class AssistantController:
 
         self._push_results(matches)
         self._log(f"{len(matches)} item(s) found. Select from display.")
+        self._prefetch_attachments(matches)
+
+    def _prefetch_attachments(self, items: List[dict]) -> None:
+        # Returns immediately; the next clip can start while attachments load.
+        self._attachments = self._zotero_client.prefetch_attachments(items)
+
+    def _prefetched_attachments(self, key: str) -> Optional[List[dict]]:
+        future = self._attachments.get(key)
+        if future is None:
+            return None
+        try:
+            return future.result()
+        except Exception as exc:
+            # None makes the Zotero client look the attachments up directly.
+            self._log(f"Attachment prefetch failed: {exc}")
+            return None
 
     def _extract_query(self, transcript: str) -> Optional[str]:
         stripped = transcript.strip()
         if not stripped:
             return None
-        lowered = stripped.lower()
-        for keyword in self._settings.activation_keywords:
-            if keyword and keyword in lowered:
-                idx = lowered.index(keyword) + len(keyword)
-                remainder = stripped[idx:].strip().strip(",.:")
-                return remainder or stripped
+        if self._activation_pattern is None:
+            return stripped
+        match = self._activation_pattern.search(stripped)
+        if match:
+            remainder = stripped[match.end():].strip().strip(",.:")
+            return remainder or stripped
         return stripped
 
     def _push_status(self, active: bool) -> None:
-        for callback in self._listeners:
-            callback(active)
+        self._listeners.notify(active)
 
     def _log(self, message: str) -> None:
-        for logger in self._loggers:
-            logger(message)
+        self._log_queue.append(message)
 
     def _push_transcript(self, transcript: str) -> None:
-        for callback in self._transcript_listeners:
-            callback(transcript)
+        self._transcript_listeners.notify(transcript)
 
     def _push_recording_state(self, active: bool) -> None:
-        for callback in self._recording_state_listeners:
-            callback(active)
+        self._recording_state_listeners.notify(active)
+
+    def _push_processing_state(self, active: bool) -> None:
+        self._processing_listeners.notify(active)
 
     def _push_results(self, items: List[dict]) -> None:
         self._latest_results = items
-        for callback in self._results_listeners:
-            callback(items)
+        self._results_listeners.notify(items)
 
     def _prompt_retry(self, expand_allowed: bool) -> str:
         if not self._retry_prompt:
@@ -203,26 +335,12 @@ class AssistantController:
         return self._retry_prompt(expand_allowed)
 
     def _summarize_intent(self, intent: SearchIntent) -> str:
-        labels: List[str] = []
-        values: List[str] = []
-        if intent.author:
-            labels.append("author")
-            values.append(intent.author)
-        if intent.title:
-            labels.append("title")
-            values.append(intent.title)
-        if intent.year:
-            labels.append("year")
-            values.append(intent.year)
-        if labels:
-            if len(labels) == 1:
-                field_text = labels[0]
-            elif len(labels) == 2:
-                field_text = " and ".join(labels)
-            else:
-                field_text = ", ".join(labels[:-1]) + f", and {labels[-1]}"
-            suffix = "field" if len(labels) == 1 else "fields"
-            return f"Inputs for {field_text} {suffix} detected: {', '.join(values)}."
+        mask = bool(intent.author) | bool(intent.title) << 1 | bool(intent.year) << 2
+        if mask:
+            values = ", ".join(
+                value for value in (intent.author, intent.title, intent.year) if value
+            )
+            return f"Inputs for {_INTENT_FIELD_TEXT[mask]} detected: {values}."
         return f"Keyword search terms detected: {intent.search_terms}"
 
     def _run_search(
@@ -252,3 +370,27 @@ class AssistantController:
     @property
     def is_listening(self) -> bool:
         return self._listening
+
+    @property
+    def is_processing(self) -> bool:
+        """True while a captured clip is queued or being transcribed and searched."""
+        return self._clips_in_flight > 0
+
+    @property
+    def input_level(self) -> float:
+        return self._audio_capture.live_level
+
+
+def _compile_activation_pattern(keywords: Iterable[str]) -> Optional[re.Pattern[str]]:
+    """Build one alternation over the activation keywords.
+
+    The query starts after the keyword that occurs earliest in the transcript,
+    not the first one in settings order. ``re`` still tries each alternative at
+    every offset, so this saves the per-keyword Python loop, not the comparisons.
+    """
+    # Longest first so keywords starting at the same offset prefer the most specific phrase.
+    cleaned = sorted({keyword.lower() for keyword in keywords if keyword}, key=len, reverse=True)
+    if not cleaned:
+        return None
+    # IGNORECASE lets the transcript be searched as-is, without a lowered copy.
+    return re.compile("|".join(re.escape(keyword) for keyword in cleaned), re.IGNORECASE)
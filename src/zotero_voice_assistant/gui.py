@@ -1,9 +1,11 @@
 from __future__ import annotations
 
-import threading
 import tkinter as tk
 from tkinter import messagebox, simpledialog, ttk
-from typing import Callable, List
+from collections import deque
+from concurrent.futures import Future
+from queue import Empty, SimpleQueue
+from typing import Callable, Deque, List
 import os
 import webbrowser
 
@@ -12,15 +14,20 @@ try:
 except ImportError:  # pragma: no cover - fallback for direct execution
     from controller import AssistantController  # type: ignore
 
+_NO_RESULTS = "No results yet"
+
 
 class AssistantGUI:
     def __init__(self, controller: AssistantController) -> None:
         self._controller = controller
+        # Callables posted by worker threads; run on the Tk thread by _pump_events.
+        self._pending: SimpleQueue[Callable[[], None]] = SimpleQueue()
         self._controller.add_status_listener(self._handle_status)
         self._controller.add_log_listener(self._append_log)
         self._controller.add_transcript_listener(self._handle_transcript)
         self._controller.add_recording_listener(self._handle_recording_state)
         self._controller.add_results_listener(self._handle_results)
+        self._controller.add_processing_listener(self._handle_processing)
         self._controller.set_retry_prompt_handler(self._prompt_retry)
 
         self._root = tk.Tk()
@@ -31,7 +38,12 @@ class AssistantGUI:
         self._transcript_var = tk.StringVar(value="Waiting for audio...")
         self._recording_state = tk.BooleanVar(value=False)
         self._results: List[dict] = []
+        self._result_labels: List[str] = []
         self._session_active = False
+        self._processing = False
+        # Log lines are batched and written to the Text widget at most every 50 ms.
+        self._log_buffer: Deque[str] = deque()
+        self._log_flush_pending = False
 
         header = ttk.Label(
             self._root,
@@ -70,7 +82,11 @@ class AssistantGUI:
         results_frame.pack(fill=tk.BOTH, expand=True, padx=16, pady=(0, 8))
         list_container = ttk.Frame(results_frame)
         list_container.pack(fill=tk.BOTH, expand=True, padx=8, pady=8)
-        self._results_list = tk.Listbox(list_container, height=8, activestyle="dotbox")
+        # The listbox mirrors this Tcl list, so a refresh is a single variable write.
+        self._results_var = tk.Variable(value=(_NO_RESULTS,))
+        self._results_list = tk.Listbox(
+            list_container, height=8, activestyle="dotbox", listvariable=self._results_var
+        )
         scrollbar = ttk.Scrollbar(
             list_container, orient=tk.VERTICAL, command=self._results_list.yview
         )
@@ -79,7 +95,7 @@ class AssistantGUI:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self._results_list.bind("<<ListboxSelect>>", lambda _event: self._update_button_state())
         self._results_list.bind("<Double-Button-1>", lambda _event: self._open_selected())
-        self._results_list.insert(tk.END, "No results yet")
+        self._displayed_rows: List[str] = [_NO_RESULTS]
 
         button_row = ttk.Frame(results_frame)
         button_row.pack(fill=tk.X, padx=8, pady=(0, 4))
@@ -91,13 +107,27 @@ class AssistantGUI:
         self._clear_button.pack(side=tk.LEFT, padx=(8, 0))
         self._open_button.configure(state=tk.DISABLED)
         self._clear_button.configure(state=tk.DISABLED)
+        self._last_open_state = tk.DISABLED
+        self._last_clear_state = tk.DISABLED
 
         self._log = tk.Text(self._root, height=8, state="disabled")
         self._log.pack(fill=tk.BOTH, expand=True, padx=16, pady=(0, 16))
+        self._root.after(10, self._pump_events)
 
     def run(self) -> None:
         self._root.mainloop()
 
+    def _pump_events(self) -> None:
+        # Re-arm first so a modal dialog opened below does not pause the pump.
+        self._root.after(10, self._pump_events)
+        self._controller.drain_logs()
+        while True:
+            try:
+                func = self._pending.get_nowait()
+            except Empty:
+                break
+            func()
+
     def _handle_record_button(self) -> None:
         if self._session_active:
             self._record_button.configure(text="Stopping...")
@@ -109,23 +139,47 @@ class AssistantGUI:
 
     def _handle_status(self, active: bool) -> None:
         def update() -> None:
-            self._status_var.set("Active" if active else "Inactive")
             self._session_active = active
+            self._refresh_status()
             self._record_button.configure(text="Stop Recording" if active else "Ask Cite-GPT")
             if not active:
                 self._recording_badge.set_state(False)
 
         self._schedule(update)
 
-    def _append_log(self, message: str) -> None:
+    def _handle_processing(self, active: bool) -> None:
         def update() -> None:
-            self._log.configure(state="normal")
-            self._log.insert(tk.END, f"{message}\n")
-            self._log.configure(state="disabled")
-            self._log.see(tk.END)
+            self._processing = active
+            self._refresh_status()
 
         self._schedule(update)
 
+    def _refresh_status(self) -> None:
+        if self._session_active:
+            self._status_var.set("Active")
+        elif self._processing:
+            self._status_var.set("Processing")
+        else:
+            self._status_var.set("Inactive")
+
+    def _append_log(self, message: str) -> None:
+        self._log_buffer.append(message)
+        if not self._log_flush_pending:
+            self._log_flush_pending = True
+            self._root.after(50, self._flush_log)
+
+    def _flush_log(self) -> None:
+        self._log_flush_pending = False
+        batch = []
+        while self._log_buffer:
+            batch.append(self._log_buffer.popleft())
+        if not batch:
+            return
+        self._log.configure(state="normal")
+        self._log.insert(tk.END, "\n".join(batch) + "\n")
+        self._log.configure(state="disabled")
+        self._log.see(tk.END)
+
     def _handle_transcript(self, transcript: str) -> None:
         def update() -> None:
             if transcript.strip():
@@ -139,26 +193,40 @@ class AssistantGUI:
         def update() -> None:
             self._recording_state.set(active)
             self._recording_badge.set_state(active)
+            if active:
+                self._poll_input_level()
 
         self._schedule(update)
 
+    def _poll_input_level(self) -> None:
+        if not self._recording_state.get():
+            self._recording_badge.set_level(0.0)
+            return
+        self._recording_badge.set_level(self._controller.input_level)
+        self._root.after(50, self._poll_input_level)
+
     def _handle_results(self, items: List[dict]) -> None:
         def update() -> None:
             self._results = items
-            self._results_list.delete(0, tk.END)
+            self._result_labels = [_format_item_label(item) for item in items]
             if not items:
-                self._results_list.insert(tk.END, "No results yet")
-                self._open_button.configure(state=tk.DISABLED)
-                self._clear_button.configure(state=tk.DISABLED)
+                self._show_rows([_NO_RESULTS])
+                self._set_button_states(tk.DISABLED, tk.DISABLED)
                 return
-            for item in items:
-                self._results_list.insert(tk.END, _format_item_label(item))
+            self._show_rows(self._result_labels)
             self._results_list.selection_clear(0, tk.END)
             self._results_list.selection_set(0)
             self._update_button_state()
 
         self._schedule(update)
 
+    def _show_rows(self, rows: List[str]) -> None:
+        """Show ``rows`` in the results listbox; unchanged rows cost no Tcl calls."""
+        if rows == self._displayed_rows:
+            return
+        self._results_var.set(tuple(rows))
+        self._displayed_rows = list(rows)
+
     def _open_selected(self) -> None:
         selection = self._results_list.curselection()
         if not selection or selection[0] >= len(self._results):
@@ -190,32 +258,42 @@ class AssistantGUI:
 
     def _clear_results(self) -> None:
         self._results = []
-        self._results_list.delete(0, tk.END)
-        self._results_list.insert(tk.END, "No results yet")
-        self._open_button.configure(state=tk.DISABLED)
-        self._clear_button.configure(state=tk.DISABLED)
+        self._result_labels = []
+        self._show_rows([_NO_RESULTS])
+        self._set_button_states(tk.DISABLED, tk.DISABLED)
 
     def _update_button_state(self) -> None:
         valid = bool(self._results and self._results_list.curselection())
-        self._open_button.configure(state=tk.NORMAL if valid else tk.DISABLED)
-        self._clear_button.configure(state=tk.NORMAL if self._results else tk.DISABLED)
+        self._set_button_states(
+            tk.NORMAL if valid else tk.DISABLED,
+            tk.NORMAL if self._results else tk.DISABLED,
+        )
+
+    def _set_button_states(self, open_state: str, clear_state: str) -> None:
+        # Only reconfigure on change; selection events fire on every arrow key press.
+        if open_state != self._last_open_state:
+            self._open_button.configure(state=open_state)
+            self._last_open_state = open_state
+        if clear_state != self._last_clear_state:
+            self._clear_button.configure(state=clear_state)
+            self._last_clear_state = clear_state
 
     def _prompt_retry(self, expand_allowed: bool) -> str:
-        response_holder = {"value": "retry"}
-        wait_event = threading.Event()
+        choice: Future[str] = Future()
+        self._schedule(lambda: self._show_retry(choice, expand_allowed))
+        return choice.result()
 
-        def prompt() -> None:
+    def _show_retry(self, choice: Future[str], expand_allowed: bool) -> None:
+        try:
             dialog = RetryDialog(self._root, expand_allowed)
-            response_holder["value"] = dialog.result or "cancel"
-            wait_event.set()
-
-        self._schedule(prompt)
-        wait_event.wait()
-        return response_holder["value"]
+        except BaseException as exc:
+            choice.set_exception(exc)
+            raise
+        choice.set_result(dialog.result or "cancel")
 
     def _schedule(self, func: Callable[[], None]) -> None:
-        if self._root.winfo_exists():
-            self._root.after(0, func)
+        # Safe from any thread: no Tcl call happens until the Tk thread pumps the queue.
+        self._pending.put(func)
 
 
 class RecordingBadge(ttk.Frame):
@@ -226,6 +304,8 @@ class RecordingBadge(ttk.Frame):
         self._canvas.pack(side=tk.LEFT, padx=(0, 8))
         self._label = ttk.Label(self, text="Idle")
         self._label.pack(side=tk.LEFT)
+        self._meter = ttk.Progressbar(self, orient=tk.HORIZONTAL, maximum=1.0, length=160)
+        self._meter.pack(side=tk.RIGHT)
 
     def set_state(self, active: bool) -> None:
         color = "#ef4444" if active else "#9ca3af"
@@ -233,6 +313,9 @@ class RecordingBadge(ttk.Frame):
         self._canvas.itemconfig(self._dot, fill=color)
         self._label.configure(text=text)
 
+    def set_level(self, level: float) -> None:
+        self._meter.configure(value=level)
+
 
 class RetryDialog(simpledialog.Dialog):
     def __init__(self, parent: tk.Misc, expand_allowed: bool) -> None:
@@ -270,11 +353,17 @@ class RetryDialog(simpledialog.Dialog):
 
 
 def _format_item_label(item: dict) -> str:
+    cached = item.get("_label_cache")
+    if cached is not None:
+        return cached
     data = item.get("data", {})
     title = data.get("title", "Untitled")
     author = _format_authors(data)
     year = (data.get("date") or "").split("-")[0]
-    return f"{title} — {author} ({year})".strip()
+    label = f"{title} — {author} ({year})".strip()
+    # Memoize on the item so repeated refreshes skip re-walking the creators list.
+    item["_label_cache"] = label
+    return label
 
 
 def _format_authors(data: dict) -> str:
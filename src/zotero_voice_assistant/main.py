@@ -4,7 +4,7 @@ from .audio import AudioCaptureService
 from .config import get_settings
 from .controller import AssistantController
 from .gui import AssistantGUI
-from .openai_client import OpenAIAudioClient, OpenAIIntentClient
+from .openai_client import OpenAIAudioClient, OpenAIIntentClient, create_openai_client
 from .zotero_client import ZoteroClient
 
 
@@ -16,8 +16,10 @@ def main() -> None:
         input_device=settings.audio_input_device,
         default_duration=settings.audio_default_duration,
     )
-    openai_client = OpenAIAudioClient(settings)
-    intent_parser = OpenAIIntentClient(settings)
+    # One client for both endpoints so transcription and parsing share keep-alive connections.
+    shared_openai = create_openai_client(settings)
+    openai_client = OpenAIAudioClient(settings, client=shared_openai)
+    intent_parser = OpenAIIntentClient(settings, client=shared_openai)
     zotero_client = ZoteroClient(settings)
     controller = AssistantController(
         settings=settings,
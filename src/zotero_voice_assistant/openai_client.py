@@ -1,42 +1,65 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from openai import OpenAI
-from pydantic import BaseModel
+from openai import OpenAI, Timeout
+from pydantic import BaseModel, Field
 
 from .config import AppSettings
 
 
+def create_openai_client(settings: AppSettings) -> OpenAI:
+    """Build an OpenAI client whose connection pool can be shared by every wrapper."""
+    if not settings.openai_api_key:
+        raise ValueError("OPENAI_API_KEY is required")
+    return OpenAI(
+        api_key=settings.openai_api_key,
+        timeout=Timeout(30.0, connect=5.0),
+        max_retries=2,
+    )
+
+
 class OpenAIAudioClient:
     """Thin wrapper around the OpenAI audio transcription endpoint."""
 
-    def __init__(self, settings: AppSettings) -> None:
-        if not settings.openai_api_key:
-            raise ValueError("OPENAI_API_KEY is required")
-        self._client = OpenAI(api_key=settings.openai_api_key)
+    def __init__(self, settings: AppSettings, client: Optional[OpenAI] = None) -> None:
+        self._client = client or create_openai_client(settings)
         self._model = settings.openai_model
         self._language = settings.openai_transcription_language
 
     def transcribe_file(self, audio_file: Path, prompt: Optional[str] = None) -> str:
-        if not audio_file.exists():
-            raise FileNotFoundError(audio_file)
-        with audio_file.open("rb") as handle:
-            request_kwargs = {
-                "model": self._model,
-                "file": handle,
-                "prompt": prompt,
-                "response_format": "text",
-            }
-            if self._language:
-                request_kwargs["language"] = self._language
-            response = self._client.audio.transcriptions.create(**request_kwargs)
-        return response
-
-
-@dataclass
+        try:
+            handle = audio_file.open("rb")
+        except FileNotFoundError as exc:
+            raise FileNotFoundError(audio_file) from exc
+        with handle:
+            return self._transcribe(handle, prompt)
+
+    def transcribe_buffer(
+        self, audio: bytes, filename: str = "audio.wav", prompt: Optional[str] = None
+    ) -> str:
+        """Transcribe encoded audio that is already in memory, without a temp file.
+
+        The extension of ``filename`` tells OpenAI how ``audio`` is encoded.
+        """
+        return self._transcribe((filename, audio), prompt)
+
+    def _transcribe(self, file: Any, prompt: Optional[str]) -> str:
+        request_kwargs = {
+            "model": self._model,
+            "file": file,
+            "prompt": prompt,
+            "response_format": "text",
+        }
+        if self._language:
+            request_kwargs["language"] = self._language
+        return self._client.audio.transcriptions.create(**request_kwargs)
+
+
+@dataclass(slots=True, frozen=True)
 class SearchIntent:
     raw_query: str
     search_terms: str
@@ -51,32 +74,36 @@ class SearchIntent:
 
 
 class IntentPayload(BaseModel):
-    search_terms: Optional[str] = None
-    author: Optional[str] = None
-    title: Optional[str] = None
-    year: Optional[str] = None
-    confidence: float = 0.0
+    # Field descriptions are sent with the JSON schema and carry the extraction rules.
+    search_terms: Optional[str] = Field(
+        None, description="Short keyword query, used when no precise filters are found."
+    )
+    author: Optional[str] = Field(
+        None, description="Surname of a referenced author, e.g. 'papers by Zimmerman' -> Zimmerman."
+    )
+    title: Optional[str] = Field(None, description="Title or title fragment the user mentions.")
+    year: Optional[str] = Field(None, description="Four-digit publication year.")
+    confidence: float = Field(0.0, description="Confidence between 0 and 1.")
 
 
 class OpenAIIntentClient:
     """Uses a text model to convert natural language into structured Zotero filters."""
 
     _SYSTEM_PROMPT = (
-        "You translate informal user requests about Zotero citations into structured JSON. "
-        "Always respond with the keys: search_terms, author, title, year, confidence. "
-        "Use null for any field that is not specified. "
-        "search_terms should be a short keyword query if no precise filters are found. "
-        "If the user references an author (e.g., 'papers by Zimmerman'), set author to that surname. "
-        "When they mention a title, place it in title. Year should be a four-digit string when present."
+        "Extract Zotero citation search filters from the user's request; "
+        "use null for any field that is not specified."
     )
 
-    def __init__(self, settings: AppSettings) -> None:
-        if not settings.openai_api_key:
-            raise ValueError("OPENAI_API_KEY is required")
-        self._client = OpenAI(api_key=settings.openai_api_key)
+    def __init__(self, settings: AppSettings, client: Optional[OpenAI] = None) -> None:
+        self._client = client or create_openai_client(settings)
         self._model = settings.openai_text_model
+        # Repeated voice queries reuse the earlier parse instead of another API call.
+        self._parse_cached = lru_cache(maxsize=128)(self._request_intent)
 
     def parse(self, query: str) -> SearchIntent:
+        return self._parse_cached(query)
+
+    def _request_intent(self, query: str) -> SearchIntent:
         response = self._client.responses.parse(
             model=self._model,
             temperature=0,
@@ -104,7 +131,8 @@ class OpenAIIntentClient:
 
     @staticmethod
     def _clean_field(value: Optional[str]) -> Optional[str]:
-        if value is None:
+        if not value:
             return None
-        stripped = str(value).strip()
+        # Pydantic already guarantees str; str.strip() returns the same object when clean.
+        stripped = value.strip() if isinstance(value, str) else str(value).strip()
         return stripped or None
@@ -1,14 +1,33 @@
 from __future__ import annotations
 
 import re
+import threading
+import time
 import webbrowser
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 from difflib import SequenceMatcher
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from pyzotero import zotero
 
+try:
+    from rapidfuzz import fuzz
+except ImportError:  # pragma: no cover - optional accelerator, difflib is the fallback
+    fuzz = None  # type: ignore
+
 from .config import AppSettings
 
+_YEAR_RE = re.compile(r"\d{4}")
+_FUZZY_THRESHOLD = 0.55
+# Shorter author fragments ("Li", "Wu") only match as substrings; a fuzzy ratio is noise.
+_MIN_FUZZY_AUTHOR_LENGTH = 3
+_SEARCH_CACHE_SIZE = 64
+_SEARCH_CACHE_TTL = 300.0
+_PREFETCH_WORKERS = 8
+
+_SearchKey = Tuple[str, int, Optional[str]]
+
 
 class ZoteroClient:
     """Handles read-only queries against the user's Zotero library."""
@@ -19,27 +38,54 @@ class ZoteroClient:
         self._library_id = settings.zotero_library_id
         self._library_type = settings.zotero_library_type
         self._is_local = settings.zotero_use_local
+        self._api_key = settings.zotero_api_key
+        # (query, limit, qmode) -> (fetched at, items); library contents rarely change mid-session.
+        self._search_cache: OrderedDict[_SearchKey, Tuple[float, List[dict]]] = OrderedDict()
+        # pyzotero keeps per-request state on the instance, so each thread gets its own.
+        self._thread_state = threading.local()
+        self._prefetch_executor: Optional[ThreadPoolExecutor] = None
+
+        if not self._is_local and not self._api_key:
+            raise ValueError("ZOTERO_API_KEY is required unless using the local connector")
+        self._thread_state.library = self._connect()
 
+    @property
+    def _library(self) -> zotero.Zotero:
+        library = getattr(self._thread_state, "library", None)
+        if library is None:
+            library = self._thread_state.library = self._connect()
+        return library
+
+    def _connect(self) -> zotero.Zotero:
         if self._is_local:
-            self._library = zotero.Zotero(
+            return zotero.Zotero(
                 self._library_id,
                 self._library_type,
                 local=True,
             )
-        else:
-            if not settings.zotero_api_key:
-                raise ValueError("ZOTERO_API_KEY is required unless using the local connector")
-            self._library = zotero.Zotero(
-                self._library_id,
-                self._library_type,
-                settings.zotero_api_key,
-            )
+        return zotero.Zotero(
+            self._library_id,
+            self._library_type,
+            self._api_key,
+        )
 
     def search_items(self, query: str, limit: int = 10, qmode: Optional[str] = None) -> List[dict]:
+        cache_key = (query, limit, qmode)
+        now = time.monotonic()
+        cached = self._search_cache.get(cache_key)
+        if cached is not None and now - cached[0] < _SEARCH_CACHE_TTL:
+            self._search_cache.move_to_end(cache_key)
+            return list(cached[1])
+
         kwargs = {"q": query, "limit": limit}
         if qmode:
             kwargs["qmode"] = qmode
-        return self._library.items(**kwargs)
+        results = self._library.items(**kwargs)
+        self._search_cache[cache_key] = (now, results)
+        self._search_cache.move_to_end(cache_key)
+        while len(self._search_cache) > _SEARCH_CACHE_SIZE:
+            self._search_cache.popitem(last=False)
+        return list(results)
 
     def search_by_fields(
         self,
@@ -55,39 +101,71 @@ class ZoteroClient:
         seed_results = max(limit * 3, 20)
         candidates = self._library.items(q=search_terms, limit=seed_results)
         filtered: List[dict] = []
+        expected_year = year.strip() if year else None
 
         for item in candidates:
             data = item.get("data", {})
-            if author and not _fuzzy_match(author, _authors_as_text(data)):
-                continue
+            if author:
+                # Cached on the item so display code can reuse it without re-walking creators.
+                authors = item["_authors_cached"] = _authors_as_text(data)
+                if not _fuzzy_match(author, authors, min_fuzzy_length=_MIN_FUZZY_AUTHOR_LENGTH):
+                    continue
             if title and not _fuzzy_match(title, data.get("title", "")):
                 continue
-            if year and not _year_matches(year, data.get("date", "")):
+            if expected_year and not _year_matches(expected_year, data.get("date", "")):
                 continue
             filtered.append(item)
             if len(filtered) >= limit:
                 break
         return filtered
 
-    def get_attachment_or_url(self, item: dict) -> Optional[str]:
-        attachments = self._library.children(item["key"])
+    def prefetch_attachments(self, items: List[dict]) -> Dict[str, Future[List[dict]]]:
+        """Start fetching child attachments in the background; returns futures by item key."""
+        if not items:
+            return {}
+        if self._prefetch_executor is None:
+            self._prefetch_executor = ThreadPoolExecutor(
+                max_workers=_PREFETCH_WORKERS, thread_name_prefix="zotero-prefetch"
+            )
+        return {
+            item["key"]: self._prefetch_executor.submit(self._fetch_children, item["key"])
+            for item in items
+        }
+
+    def _fetch_children(self, key: str) -> List[dict]:
+        return self._library.children(key)
+
+    def get_attachment_or_url(
+        self, item: dict, attachments: Optional[List[dict]] = None
+    ) -> Optional[str]:
+        if attachments is None:
+            attachments = self._library.children(item["key"])
         for att in attachments:
-            data = att.get("data", {})
+            try:
+                data = att["data"]
+            except KeyError:
+                continue
             if data.get("contentType") != "application/pdf":
                 continue
             local_path = data.get("path")
             if local_path:
                 return local_path
-            file_url = att.get("links", {}).get("enclosure", {}).get("href")
+            try:
+                file_url = att["links"]["enclosure"]["href"]
+            except KeyError:
+                file_url = None
             if file_url:
                 return file_url
-        url = item.get("data", {}).get("url")
+        try:
+            url = item["data"]["url"]
+        except KeyError:
+            url = None
         if url:
             return url
-        alternate = item.get("links", {}).get("alternate", {}).get("href")
-        if alternate:
-            return alternate
-        return None
+        try:
+            return item["links"]["alternate"]["href"] or None
+        except KeyError:
+            return None
 
     def open_attachment_or_url(self, item: dict) -> None:
         """Retained for CLI callers; prefers PDF attachment."""
@@ -109,14 +187,25 @@ class ZoteroClient:
         print(f"endpoint: {endpoint}", f" local: {local_yn}")
 
 
-def _fuzzy_match(expected: str, actual: str) -> bool:
+def _fuzzy_match(expected: str, actual: str, min_fuzzy_length: int = 0) -> bool:
     expected_l = expected.lower().strip()
     actual_l = actual.lower().strip()
     if not expected_l:
         return True
     if expected_l in actual_l:
         return True
-    return SequenceMatcher(None, expected_l, actual_l).ratio() >= 0.55
+    if len(expected_l) < min_fuzzy_length:
+        return False
+    if fuzz is not None:
+        # Same normalized similarity scale as difflib's ratio(), computed in C++.
+        return bool(fuzz.ratio(expected_l, actual_l, score_cutoff=_FUZZY_THRESHOLD * 100))
+    matcher = SequenceMatcher(None, expected_l, actual_l)
+    # The quick ratios are cheap upper bounds of ratio(); most misses stop here.
+    return (
+        matcher.real_quick_ratio() >= _FUZZY_THRESHOLD
+        and matcher.quick_ratio() >= _FUZZY_THRESHOLD
+        and matcher.ratio() >= _FUZZY_THRESHOLD
+    )
 
 
 def _authors_as_text(data: dict) -> str:
@@ -130,9 +219,8 @@ def _authors_as_text(data: dict) -> str:
 
 
 def _year_matches(expected_year: str, raw_date: str) -> bool:
+    """``expected_year`` must already be stripped by the caller."""
     if not expected_year:
         return True
-    match = re.search(r"\d{4}", raw_date or "")
-    if not match:
-        return False
-    return match.group(0) == expected_year.strip()
+    match = _YEAR_RE.search(raw_date or "")
+    return match is not None and match.group(0) == expected_year